@@ -1,37 +1,364 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
 import numpy as np
+import orjson
 from typing import List, Dict, Optional, Union, Any
 import logging
+import threading
+from cachetools import TTLCache, cached
+from itertools import islice
+from array import array
+
+try:
+    import ijson
+except ImportError:  # streaming of long price histories is optional
+    ijson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 load_dotenv()
 
 BASE_URL = "https://brapi.dev/"
 API_KEY = os.getenv("BRAPI_TOKEN")
 
-# Debug prints after API_KEY is defined
 logger = logging.getLogger(__name__)
-logger.info(f"API_KEY loaded: {'yes' if API_KEY else 'no'}")
-logger.info(f"API_KEY length: {len(str(API_KEY)) if API_KEY else 0}")
+logger.debug("API_KEY loaded: %s", 'yes' if API_KEY else 'no')
+
+# Opt-in display formatting to avoid scientific notation; callers otherwise
+# control pandas display options themselves
+if os.getenv('BRAPI_PRETTY_PRINT'):
+    pd.set_option('display.float_format', '{:,.4f}'.format)
+
+# (connect, read) timeouts in seconds for every API call
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Connections kept alive per host; also the upper bound on worker threads
+POOL_MAXSIZE = 32
+DEFAULT_THREADS = 8
+
+# Number of distinct (endpoint, params) raw response bodies kept in memory, and
+# for how long (seconds); the */available catalogs change rarely and live longer
+REQUEST_CACHE_SIZE = 2048
+RESPONSE_CACHE_TTL = 300
+CATALOG_CACHE_SIZE = 64
+CATALOG_CACHE_TTL = 24 * 60 * 60
+
+_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE = TTLCache(maxsize=REQUEST_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+_CATALOG_CACHE = TTLCache(maxsize=CATALOG_CACHE_SIZE, ttl=CATALOG_CACHE_TTL)
+_HISTORY_CACHE = TTLCache(maxsize=REQUEST_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
+# Default inflation/prime rate window, recomputed at most once a minute
+_DEFAULT_RANGE_CACHE = TTLCache(maxsize=1, ttl=60)
+
+# Payload keys of the quote, list, currency, inflation, prime rate and crypto
+# endpoints, checked in this order
+RESPONSE_KEYS = ('results', 'stocks', 'currency', 'inflation', 'prime-rate', 'coins')
+
+# Errors a fetcher logs and turns into an empty result: network failures and
+# malformed payloads (pyarrow's ArrowInvalid/ArrowTypeError subclass ValueError/TypeError)
+_FETCH_ERRORS = (requests.exceptions.RequestException, KeyError, IndexError, ValueError, TypeError, AttributeError)
 
-def _convert_to_float64(df):
-    """Convert numeric columns to float64 (double precision)"""
-    for col in df.columns:
+# Tickers requested per comma-separated quote call
+QUOTE_BATCH_SIZE = 20
+
+# Columns kept by fetch_available_tickers, in output order
+TICKER_LIST_COLUMNS = ('stock', 'name', 'close', 'change', 'volume', 'market_cap')
+
+# Quote ranges/intervals whose price history is stream-parsed when ijson is available
+STREAM_RANGES = ('2y', '5y', '10y', 'max')
+INTRADAY_INTERVALS = ('1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h')
+
+# Price fields served by fetch_quote_ohlcv and the fetch_quote_<field> wrappers
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Prices carry fewer than 7 significant digits, so single precision is enough
+DEFAULT_OHLC_DTYPE = 'float32'
+
+# Column dtypes that historicalDataPrice records are cast to, volume is a
+# nullable int64 so gaps from aligning tickers with different dates stay integral
+_OHLCV_DTYPES = {'date': 'int64', 'open': DEFAULT_OHLC_DTYPE, 'high': DEFAULT_OHLC_DTYPE, 'low': DEFAULT_OHLC_DTYPE, 'close': DEFAULT_OHLC_DTYPE, 'volume': 'Int64'}
+
+# Fundamentals modules of the statement/profile fetchers; pass modules=FUNDAMENTAL_MODULES
+# to any of them to fetch all in one shared (cached) request per ticker batch
+FUNDAMENTAL_MODULES = (
+    'balanceSheetHistory',
+    'balanceSheetHistoryQuarterly',
+    'incomeStatementHistory',
+    'incomeStatementHistoryQuarterly',
+    'defaultKeyStatistics',
+    'financialData',
+    'summaryProfile'
+)
+
+def _build_session():
+    """Build the shared HTTP session used for all API calls
+
+    A single session keeps the TLS connection to brapi.dev alive so repeated
+    per-ticker requests reuse the pooled socket instead of reconnecting.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.headers.update({
+        # Every encoding urllib3 can decode here (adds br/zstd when installed)
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    return session
+
+_SESSION = _build_session()
+
+def _convert_prices(df):
+    """Cast price history columns by name, OHLC to DEFAULT_OHLC_DTYPE and volume to Int64
+    
+    Callers that need double precision can upcast the result explicitly.
+    """
+    return df.astype({col: _OHLCV_DTYPES[col] for col in df.columns if col in _OHLCV_DTYPES})
+
+def _epoch_seconds_index(epochs):
+    """Build the ns-resolution UTC 'date' index shared by every price history parser
+    
+    Epoch seconds are viewed as datetime64 instead of going through
+    pd.to_datetime, whose result unit varies with the pandas version.
+    """
+    epochs = np.asarray(epochs, dtype='int64')
+    return pd.DatetimeIndex(epochs.view('datetime64[s]').astype('datetime64[ns]'), tz='UTC', name='date')
+
+def _indicator_frame(data):
+    """Build a day-indexed value frame from inflation/prime rate records
+    
+    Records are deduplicated by day while iterating, the last one wins, so no
+    duplicate mask has to be built afterwards. Days come from the integer
+    epochDate, in milliseconds or seconds judged from the first record.
+    Records without a usable epochDate are skipped and logged.
+    
+    Args:
+        data (list): Records with 'epochDate' and 'value' keys
+        
+    Returns:
+        pd.DataFrame: float64 'value' column on a sorted UTC 'date' index,
+            None if no record has an epochDate
+    """
+    epochs = []
+    for row in data:
         try:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
-        except:
+            epochs.append((int(row['epochDate']), row.get('value')))
+        except (KeyError, TypeError, ValueError):
+            continue
+            
+    if len(epochs) < len(data):
+        logger.warning("Skipped %d indicator records without a valid epochDate", len(data) - len(epochs))
+    if not epochs:
+        return None
+        
+    per_day = 86400 * 1000 if abs(epochs[0][0]) > 10**11 else 86400
+    by_day = {}
+    for epoch, value in epochs:
+        by_day[epoch // per_day] = value
+        
+    days = np.fromiter(by_day.keys(), dtype='int64', count=len(by_day))
+    index = pd.DatetimeIndex((days * 86400).view('datetime64[s]'), tz='UTC', name='date')
+    # Convert value to numeric, removing any % signs if present
+    values = pd.to_numeric(pd.Series(list(by_day.values()), dtype='string').str.rstrip('%'), errors='coerce')
+    return pd.DataFrame({'value': values.to_numpy(dtype='float64', na_value=np.nan)}, index=index).sort_index()
+
+def _ensure_sa(ticker):
+    """Append the B3 '.SA' suffix unless the ticker already has it"""
+    return ticker if ticker.endswith('.SA') else ticker + '.SA'
+
+def _validate_tickers(tickers):
+    """Normalize a ticker argument to a list of string tickers
+    
+    Args:
+        tickers (str or list): Single ticker or list of ticker symbols
+        
+    Returns:
+        list: String tickers, with invalid entries dropped and logged
+        
+    Raises:
+        ValueError: If tickers is neither a string nor a list/tuple
+    """
+    if isinstance(tickers, str):
+        return [tickers]
+    if not isinstance(tickers, (list, tuple)):
+        raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
+        
+    valid = []
+    for ticker in tickers:
+        if not isinstance(ticker, str):
+            logger.warning("Skipping invalid ticker: %s", ticker)
             continue
+        valid.append(ticker)
+    return valid
+
+def _fetch_concurrently(fetch_one, tickers, threads=None):
+    """Run a per-ticker fetch function over a thread pool
+    
+    Args:
+        fetch_one (callable): Function taking a ticker and returning its data or None
+        tickers (list): Ticker symbols to fetch
+        threads (int, optional): Number of worker threads. Defaults to DEFAULT_THREADS.
+        
+    Returns:
+        dict: Data keyed by ticker, in input order, for tickers that returned data
+    """
+    max_workers = min(threads or DEFAULT_THREADS, POOL_MAXSIZE)
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_one, ticker): i for i, ticker in enumerate(tickers)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                data = future.result()
+            except Exception:
+                # Isolate tickers, one bad payload must not cancel the batch
+                logger.exception("Error fetching data for %s", tickers[i])
+                continue
+            if data is not None:
+                fetched[i] = data
+                
+    return {tickers[i]: fetched[i] for i in sorted(fetched)}
+
+def _arrow_statements_frame(statements):
+    """Build an Arrow-backed DataFrame of statements with float64 line items
+    
+    Each line item is converted straight to a float64 Arrow array; only
+    columns Arrow cannot cast (numeric strings, mixed str/int, text) go
+    through pd.to_numeric, so both backends give the same values. Requires
+    pyarrow.
+    """
+    import pyarrow as pa
+    
+    keys = dict.fromkeys(key for statement in statements for key in statement)
+    del keys['endDate']
+    
+    columns = {'endDate': pa.array([statement['endDate'] for statement in statements])}
+    for key in keys:
+        values = [statement.get(key) for statement in statements]
+        try:
+            columns[key] = pa.array(values, type=pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            columns[key] = pa.array(pd.to_numeric(pd.Series(values, dtype=object), errors='coerce'),
+                                    type=pa.float64(), from_pandas=True)
+            
+    table = pa.table(columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+
+def _statements_to_frame(statements, in_thousands=False, backend='numpy'):
+    """Reshape a list of financial statements into a line item x date DataFrame
+    
+    Args:
+        statements (list): Statement dicts, each with an 'endDate' key
+        in_thousands (bool, optional): Divide values by 1000. Defaults to False.
+        backend (str, optional): 'numpy' for float64 columns or 'arrow' for
+            double[pyarrow] columns. Defaults to 'numpy'.
+        
+    Returns:
+        pd.DataFrame: Numeric DataFrame with line items as index and dates as columns
+    """
+    statements = [statement for statement in statements if 'endDate' in statement]
+    if not statements:
+        return pd.DataFrame()
+        
+    if backend == 'arrow':
+        df = _arrow_statements_frame(statements)
+    else:
+        df = pd.DataFrame(statements)
+        
+    df['endDate'] = pd.to_datetime(df['endDate'], format='ISO8601', cache=True).dt.strftime('%Y-%m-%d')
+    df = df.drop_duplicates('endDate', keep='last').set_index('endDate').T
+    
+    if backend != 'arrow':
+        df = df.apply(pd.to_numeric, errors='coerce')
+    if in_thousands:
+        df = df.div(1000)
+        
+    df = df.sort_index(axis=1)
+    df.index = df.index.str.replace('_', ' ').str.title()
+    df.columns.name = None
     return df
 
-def make_request(endpoint, params=None):
+class _FailedResponse(Exception):
+    """Raised inside the response caches so failed requests are not memoized"""
+
+def _cached_payload(cache, endpoint, params_key):
+    """Request a payload through a cache of raw response bodies
+    
+    Only the bytes of successful responses are stored. Every hit is decoded
+    again with orjson, which is cheaper than deep-copying the decoded payload,
+    and gives each caller its own objects to mutate.
+    
+    Args:
+        cache (TTLCache): _RESPONSE_CACHE or _CATALOG_CACHE
+        endpoint (str): API endpoint path
+        params_key (tuple): Sorted (name, value) pairs of the query parameters
+        
+    Returns:
+        dict/list: API response data if successful, None if failed
+    """
+    key = (endpoint, params_key)
+    with _CACHE_LOCK:
+        content = cache.get(key)
+    if content is not None:
+        return _decode_payload(endpoint, content)
+        
+    content = _request_content(endpoint, dict(params_key))
+    if content is None:
+        return None
+        
+    payload = _decode_payload(endpoint, content)
+    if payload is not None:
+        with _CACHE_LOCK:
+            cache[key] = content
+    return payload
+
+def clear_cache():
+    """Clear the in-process caches of API responses and parsed price histories"""
+    with _CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+        _CATALOG_CACHE.clear()
+        _HISTORY_CACHE.clear()
+        _DEFAULT_RANGE_CACHE.clear()
+
+def _write_parquet(results, path):
+    """Write per-ticker DataFrames to a single zstd-compressed Parquet file
+    
+    The frames are stacked with a 'ticker' column. Read back only what you
+    need with pd.read_parquet(path, columns=[...]) so unused columns are
+    never decoded. Requires pyarrow.
+    
+    Args:
+        results (dict): DataFrames keyed by ticker
+        path (str): Output file path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        big_df = pd.concat([df.assign(ticker=ticker) for ticker, df in results.items()])
+        pq.write_table(pa.Table.from_pandas(big_df), path, compression='zstd', use_dictionary=True)
+    except (ImportError, OSError, TypeError, ValueError) as e:
+        logger.error("Error writing Parquet file %s: %s", path, e)
+
+def make_request(endpoint, params=None, cache=True):
     """Make a request to the Brapi API
     
     Args:
         endpoint (str): API endpoint path
         params (dict, optional): Query parameters. Defaults to None.
+        cache (bool, optional): Reuse a recent response for the same endpoint
+            and params within this process. Defaults to True.
         
     Returns:
         dict/list: API response data if successful, None if failed
@@ -42,161 +369,391 @@ def make_request(endpoint, params=None):
     # Add token to params if it exists
     if API_KEY:
         params['token'] = API_KEY
-    
+        
+    if cache:
+        try:
+            params_key = tuple(sorted(params.items()))
+            hash(params_key)
+        except TypeError:
+            # Unhashable param values (e.g. lists) are requested uncached
+            params_key = None
+            
+        if params_key is not None:
+            cache_store = _CATALOG_CACHE if endpoint.rstrip('/').endswith('/available') else _RESPONSE_CACHE
+            return _cached_payload(cache_store, endpoint, params_key)
+                
+    return _request(endpoint, params)
+
+def _request(endpoint, params):
+    """Perform the HTTP request and unwrap the response payload"""
+    content = _request_content(endpoint, params)
+    if content is None:
+        return None
+    return _decode_payload(endpoint, content)
+
+def _request_content(endpoint, params):
+    """Perform the HTTP request and return the raw body of a successful response"""
     try:
         url = f"{BASE_URL}{endpoint}"
-        logger.debug(f"Making request to: {url}")
-        logger.debug(f"With params: {params}")
-        
-        response = requests.get(url, params=params)
-        logger.debug(f"Response status code: {response.status_code}")
+        logger.debug("Making request to: %s", url)
+        logger.debug("With params: %s", params)
         
-        # Handle common error status codes based on documentation
-        if response.status_code == 400:
-            logger.warning("Bad Request: The request was malformed or invalid")
-            return None
+        response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        return _check_response(response)
             
-        if response.status_code == 401:
-            logger.warning("Unauthorized: Invalid or missing authentication token")
-            return None
-            
-        if response.status_code == 402:
-            logger.warning("Payment Required: API request limit reached")
-            return None
-            
-        if response.status_code == 404:
-            logger.warning("Not Found: Requested resource not found")
-            return None
-            
-        if response.status_code == 417:
-            logger.warning("Expectation Failed: Invalid query parameters")
-            return None
-            
-        if response.status_code != 200:
-            logger.error(f"Error response: {response.text}")
-            return None
+    except requests.exceptions.RequestException as e:
+        logger.error("Request error for %s: %s", endpoint, e)
+        return None
+
+def _unwrap_response(endpoint, response):
+    """Check the status of an API response and extract its payload
+    
+    Only relies on status_code, text and content, so it serves both
+    requests and httpx responses.
+    
+    Args:
+        endpoint (str): API endpoint path, used in log messages
+        response: HTTP response object
+        
+    Returns:
+        dict/list: API response data if successful, None if failed
+    """
+    content = _check_response(response)
+    if content is None:
+        return None
+    return _decode_payload(endpoint, content)
+
+def _check_response(response):
+    """Check the status of an API response
+    
+    Args:
+        response: requests or httpx response object
+        
+    Returns:
+        bytes: Raw response body if the status is 200, None otherwise
+    """
+    logger.debug("Response status code: %s", response.status_code)
+    
+    # Handle common error status codes based on documentation
+    if response.status_code == 400:
+        logger.warning("Bad Request: The request was malformed or invalid")
+        return None
+        
+    if response.status_code == 401:
+        logger.warning("Unauthorized: Invalid or missing authentication token")
+        return None
+        
+    if response.status_code == 402:
+        logger.warning("Payment Required: API request limit reached")
+        return None
+        
+    if response.status_code == 404:
+        logger.warning("Not Found: Requested resource not found")
+        return None
+        
+    if response.status_code == 417:
+        logger.warning("Expectation Failed: Invalid query parameters")
+        return None
+        
+    if response.status_code != 200:
+        logger.error("Error response: %s", response.text)
+        return None
+        
+    return response.content
+
+def _decode_payload(endpoint, content):
+    """Decode a response body and extract its payload
+    
+    Args:
+        endpoint (str): API endpoint path, used in log messages
+        content (bytes): Raw body of a successful response
+        
+    Returns:
+        dict/list: API response data if successful, None if failed
+    """
+    try:
+        json_response = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        logger.error("JSON decode error for %s: %s", endpoint, e)
+        return None
+        
+    if logger.isEnabledFor(logging.DEBUG):
+        # Only stringify (possibly multi-MB) payloads when debug logging is on
+        logger.debug("Response content: %s...", str(json_response)[:500])
+    
+    # Check for error field in response
+    if isinstance(json_response, dict) and json_response.get('error'):
+        logger.error("API Error: %s", json_response.get('message', 'Unknown error'))
+        return None
+        
+    # Handle different response formats based on endpoint
+    if isinstance(json_response, dict):
+        for key in RESPONSE_KEYS:
+            payload = json_response.get(key)
+            if payload is not None:
+                return payload
+                
+        # Return full response if no specific field found
+        return json_response
+        
+    return json_response
+
+def _records_to_columns(records):
+    """Transpose price records into typed column arrays
+    
+    Args:
+        records (list): Row dicts sharing the keys of the first row, with
+            'date' in epoch seconds
+        
+    Returns:
+        dict: Column name to numpy array (int64 dates, float64 values)
+    """
+    count = len(records)
+    columns = {}
+    for key in records[0]:
+        if key == 'date':
+            columns[key] = np.fromiter((row['date'] for row in records), dtype=np.int64, count=count)
+            continue
+        values = [row.get(key) for row in records]
+        try:
+            columns[key] = np.fromiter((np.nan if v is None else v for v in values),
+                                       dtype=np.float64, count=count)
+        except (TypeError, ValueError):
+            # Non-numeric field, keep as object
+            columns[key] = values
+    return columns
+
+def _parse_quote_entry(entry, fundamental=False, dividends=False):
+    """Build the historical price DataFrame for a single quote result
+    
+    Args:
+        entry (dict): One item of the quote endpoint's results list
+        fundamental (bool): Attach fundamentals as columns
+        dividends (bool): Join dividend data on date
+        
+    Returns:
+        pd.DataFrame: Price history indexed by UTC date, None if the entry has none
+    """
+    historical_data = entry.get('historicalDataPrice', [])
+    if not historical_data:
+        return None
+        
+    # Create DataFrame for this ticker
+    df = pd.DataFrame(_records_to_columns(historical_data), copy=False)
+    
+    # Dates are epoch seconds for every interval
+    df.index = _epoch_seconds_index(df.pop('date'))
+    
+    # Add fundamental data if requested
+    if fundamental:
+        fund_data = entry.get('fundamentals', {})
+        for key, value in fund_data.items():
+            df[f'fundamental_{key}'] = value
+            
+    # Add dividend data if requested    
+    if dividends:
+        div_data = entry.get('dividendsData', {})
+        if div_data:
+            div_df = pd.DataFrame(div_data)
+            div_df['date'] = pd.to_datetime(div_df['date'], utc=True, cache=True)
+            div_df.set_index('date', inplace=True)
+            df = df.join(div_df, how='left')
             
-        json_response = response.json()
-        logger.debug(f"Response content: {str(json_response)[:500]}...")
+    return df
+
+def _fetch_quote_entries(tickers, params, threads=None):
+    """Fetch raw quote results for many tickers using comma-separated batches
+    
+    Tickers are requested QUOTE_BATCH_SIZE at a time as a single
+    api/quote/A.SA,B.SA,... call and the results list is split back by symbol,
+    case-insensitively. If a batch fails (e.g. one unknown symbol), its tickers
+    are retried individually, as are tickers a successful batch left out.
+    
+    Args:
+        tickers (list): Validated ticker symbols
+        params (dict): Query parameters shared by every request
+        threads (int, optional): Number of concurrent batches. Defaults to DEFAULT_THREADS.
         
-        # Check for error field in response
-        if isinstance(json_response, dict) and json_response.get('error'):
-            logger.error(f"API Error: {json_response.get('message', 'Unknown error')}")
+    Returns:
+        dict: Result entry dicts keyed by ticker, in input order
+    """
+    def _fetch_one(ticker):
+        response = make_request(f'api/quote/{_ensure_sa(ticker)}', dict(params))
+        if not response:
             return None
             
-        # Handle different response formats based on endpoint
-        if isinstance(json_response, dict):
-            # Quote endpoint
-            if 'results' in json_response:
-                return json_response['results']
-            
-            # List endpoint    
-            if 'stocks' in json_response:
-                return json_response['stocks']
-                
-            # Currency endpoint
-            if 'currency' in json_response:
-                return json_response['currency']
-                
-            # Inflation endpoint
-            if 'inflation' in json_response:
-                return json_response['inflation']
-                
-            # Prime rate endpoint    
-            if 'prime-rate' in json_response:
-                return json_response['prime-rate']
-                
-            # Crypto endpoint
-            if 'coins' in json_response:
-                return json_response['coins']
-                
-            # Return full response if no specific field found
-            return json_response
-            
-        return json_response
+        entry = response[0] if isinstance(response, list) else response
+        return entry if isinstance(entry, dict) else None
+        
+    def _fetch_batch(batch):
+        if len(batch) == 1:
+            entry = _fetch_one(batch[0])
+            return {batch[0]: entry} if entry is not None else {}
             
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request error for {endpoint}: {str(e)}")
-        return None
-    except ValueError as e:
-        logger.error(f"JSON decode error for {endpoint}: {str(e)}")
+        ticker_csv = ','.join(_ensure_sa(ticker) for ticker in batch)
+        
+        response = make_request(f'api/quote/{ticker_csv}', dict(params))
+        if not isinstance(response, list):
+            # One bad symbol can fail the whole batch; fall back to single requests
+            logger.warning("Batch quote request failed for %s, retrying per ticker", ticker_csv)
+            batch_entries = {}
+            for ticker in batch:
+                entry = _fetch_one(ticker)
+                if entry is not None:
+                    batch_entries[ticker] = entry
+            return batch_entries
+            
+        # The API echoes symbols in its own case and without '.SA', and several
+        # inputs ('PETR4', 'petr4.SA') can name the same symbol
+        by_symbol = {}
+        for ticker in batch:
+            by_symbol.setdefault(_ensure_sa(ticker.upper()), []).append(ticker)
+            
+        batch_entries = {}
+        for entry in response:
+            if not isinstance(entry, dict):
+                continue
+            for ticker in by_symbol.get(_ensure_sa(str(entry.get('symbol', '')).upper()), ()):
+                batch_entries[ticker] = entry
+                
+        # A successful batch can still leave symbols out, fetch those on their own
+        for ticker in batch:
+            if ticker not in batch_entries:
+                entry = _fetch_one(ticker)
+                if entry is not None:
+                    batch_entries[ticker] = entry
+        return batch_entries
+        
+    ticker_iter = iter(tickers)
+    batches = list(iter(lambda: tuple(islice(ticker_iter, QUOTE_BATCH_SIZE)), ()))
+    
+    entries = {}
+    for batch_entries in _fetch_concurrently(_fetch_batch, batches, threads).values():
+        entries.update(batch_entries)
+        
+    return {ticker: entries[ticker] for ticker in tickers if ticker in entries}
+
+def _fetch_fundamentals(tickers, modules, threads=None):
+    """Fetch one or more fundamentals modules for many tickers in one pass
+    
+    The modules are requested together, so fetchers passing the same modules
+    share a single (cached) response per ticker batch. Requesting more than a
+    fetcher needs downloads the extra modules, and a module the API rejects
+    fails the whole request.
+    
+    Args:
+        tickers (list): Validated ticker symbols
+        modules (tuple): brapi module names
+        threads (int, optional): Number of concurrent batches. Defaults to DEFAULT_THREADS.
+        
+    Returns:
+        dict: {ticker: {module: payload}} for tickers and modules with data
+    """
+    params = {
+        'fundamental': 'true',
+        'modules': ','.join(modules)
+    }
+    
+    entries = _fetch_quote_entries(tickers, params, threads)
+    return {ticker: {module: entry[module] for module in modules if entry.get(module)}
+            for ticker, entry in entries.items()}
+
+def _is_long_history(range, interval):
+    """Whether a quote request returns enough price rows to be worth streaming"""
+    return range in STREAM_RANGES or (interval in INTRADAY_INTERVALS and range != '1d')
+
+def _stream_price_history(ticker, params):
+    """Stream-parse one ticker's historicalDataPrice straight into column arrays
+    
+    The response body is decoded incrementally with ijson, so neither the full
+    JSON document nor a list of per-row dicts is held in memory.
+    
+    Args:
+        ticker (str): Ticker symbol
+        params (dict): Quote query parameters
+        
+    Returns:
+        pd.DataFrame: Price history indexed by UTC date, None if failed or empty
+    """
+    endpoint = f'api/quote/{_ensure_sa(ticker)}'
+    params = dict(params)
+    if API_KEY:
+        params['token'] = API_KEY
+        
+    try:
+        with _SESSION.get(f"{BASE_URL}{endpoint}", params=params,
+                          timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code != 200:
+                return _unwrap_response(endpoint, response)
+                
+            # Let urllib3 undo gzip/br so ijson sees plain JSON
+            response.raw.decode_content = True
+            rows = ijson.items(response.raw, 'results.item.historicalDataPrice.item', use_float=True)
+            
+            # Columns follow the first row's keys, like _records_to_columns
+            dates = array('q')
+            values = None
+            for row in rows:
+                if values is None:
+                    values = {field: array('d') for field in row if field != 'date'}
+                dates.append(int(row['date']))
+                for field, column in values.items():
+                    value = row.get(field)
+                    try:
+                        column.append(np.nan if value is None else value)
+                    except TypeError:
+                        # Non-numeric field, keep as object
+                        values[field] = column = list(column)
+                        column.append(value)
+                        
+    except (requests.exceptions.RequestException, ijson.JSONError, TypeError, ValueError) as e:
+        logger.error("Error streaming price history for %s: %s", endpoint, e)
         return None
-    except Exception as e:
-        logger.error(f"Unexpected error for {endpoint}: {str(e)}")
+        
+    if not dates:
         return None
+        
+    index = _epoch_seconds_index(np.frombuffer(dates, dtype=np.int64))
+    columns = {field: np.frombuffer(column, dtype=np.float64) if isinstance(column, array) else column
+               for field, column in values.items()}
+    return pd.DataFrame(columns, index=index)
 
-def fetch_quote(tickers, range='1d', interval='1d', fundamental=False, dividends=False, modules=None):
+def fetch_quote(tickers, range='1d', interval='1d', fundamental=False, dividends=False, modules=None, threads: Optional[int] = None, to_parquet_path: Optional[str] = None):
     """Fetch quote data with expanded options"""
     try:
         # Handle single ticker or list of tickers
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
+        single = isinstance(tickers, str) or (isinstance(tickers, (list, tuple)) and len(tickers) == 1)
+        tickers = _validate_tickers(tickers)
             
-        results = {}
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval,
-                'fundamental': str(fundamental).lower(),
-                'dividends': str(dividends).lower()
-            }
-            
-            if modules:
-                params['modules'] = modules
+        params = {
+            'range': range,
+            'interval': interval,
+            'fundamental': str(fundamental).lower(),
+            'dividends': str(dividends).lower()
+        }
+        
+        if modules:
+            params['modules'] = modules
             
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            # Extract historical price data
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                # Create DataFrame for this ticker
-                df = pd.DataFrame(historical_data)
-                
-                # Convert date based on interval
-                intraday_intervals = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h']
-                if interval in intraday_intervals:
-                    df['date'] = pd.to_datetime(df['date'], unit='s')
-                else:
-                    df['date'] = pd.to_datetime(df['date'], unit='s')
+        if ijson is not None and not (fundamental or dividends or modules) and _is_long_history(range, interval):
+            # Long histories are streamed per ticker to keep peak memory flat
+            results = _fetch_concurrently(lambda ticker: _stream_price_history(ticker, params), tickers, threads)
+        else:
+            results = {}
+            for ticker, entry in _fetch_quote_entries(tickers, params, threads).items():
+                df = _parse_quote_entry(entry, fundamental, dividends)
+                if df is not None:
+                    results[ticker] = df
                     
-                df.set_index('date', inplace=True)
-                
-                # Add fundamental data if requested
-                if fundamental and isinstance(response, dict):
-                    fund_data = response.get('fundamentals', {})
-                    for key, value in fund_data.items():
-                        df[f'fundamental_{key}'] = value
-                        
-                # Add dividend data if requested    
-                if dividends and isinstance(response, dict):
-                    div_data = response.get('dividendsData', {})
-                    if div_data:
-                        div_df = pd.DataFrame(div_data)
-                        div_df['date'] = pd.to_datetime(div_df['date'])
-                        div_df.set_index('date', inplace=True)
-                        df = df.join(div_df, how='left')
-                        
-                results[ticker] = df
-                
-        return results if len(tickers) > 1 else results[tickers[0]] if results else None
+        if results and to_parquet_path:
+            _write_parquet(results, to_parquet_path)
+            
+        if single:
+            return results.get(tickers[0]) if tickers else None
+        return results
         
-    except Exception as e:
-        logger.error(f"Error fetching quote data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching quote data: %s", e)
         return None
 
 def fetch_quote_list(search=None, sortBy=None, sortOrder='desc', limit=None, sector=None):
@@ -229,8 +786,8 @@ def fetch_quote_list(search=None, sortBy=None, sortOrder='desc', limit=None, sec
         if response:
             return {'stocks': pd.DataFrame(response)}
         return {'stocks': pd.DataFrame()}
-    except Exception as e:
-        logger.error(f"Error fetching quote list: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching quote list: %s", e)
         return {'stocks': pd.DataFrame()}
 
 def fetch_currency(currencies, token=None):
@@ -244,12 +801,12 @@ def fetch_currency(currencies, token=None):
         if response and isinstance(response, list):
             df = pd.DataFrame(response)
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date']).strftime('%Y-%m-%d')
+                df['date'] = pd.to_datetime(df['date'], format='ISO8601', cache=True).dt.strftime('%Y-%m-%d')
                 df.set_index('date', inplace=True)
             return df
         return None
-    except Exception as e:
-        logger.error(f"Error fetching currency data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching currency data: %s", e)
         return None
 
 def fetch_crypto(coins, currency='BRL'):
@@ -264,12 +821,12 @@ def fetch_crypto(coins, currency='BRL'):
         if response and isinstance(response, list):
             df = pd.DataFrame(response)
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date']).strftime('%Y-%m-%d')
+                df['date'] = pd.to_datetime(df['date'], format='ISO8601', cache=True).dt.strftime('%Y-%m-%d')
                 df.set_index('date', inplace=True)
             return df
         return None
-    except Exception as e:
-        logger.error(f"Error fetching crypto data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching crypto data: %s", e)
         return None
 
 def fetch_available_tickers(search=None):
@@ -298,426 +855,211 @@ def fetch_available_tickers(search=None):
             # Create DataFrame from response
             df = pd.DataFrame(response)
             
-            # Rename columns for clarity if needed
-            column_mapping = {
-                'stock': 'stock',
-                'name': 'name',
-                'close': 'close',
-                'change': 'change',
-                'volume': 'volume',
-                'market_cap': 'market_cap'
-            }
-            
-            # Select and rename columns if they exist
-            available_columns = [col for col in column_mapping.keys() if col in df.columns]
-            df = df[available_columns].rename(columns=column_mapping)
+            # Select columns if they exist
+            df = df[[col for col in TICKER_LIST_COLUMNS if col in df.columns]]
             
             # Convert numeric columns
             numeric_columns = ['close', 'change', 'volume', 'market_cap']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            present = [col for col in numeric_columns if col in df.columns]
+            df[present] = df[present].apply(pd.to_numeric, errors='coerce')
             
-            # Sort by stock symbol
-            df.sort_values('stock', inplace=True)
-            
-            # Reset index
-            df.reset_index(drop=True, inplace=True)
+            # Sort by stock symbol with a fresh 0..n index
+            df.sort_values('stock', ignore_index=True, inplace=True)
             
             return df
             
         return pd.DataFrame()
         
-    except Exception as e:
-        logger.error(f"Error fetching available tickers: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching available tickers: %s", e)
         return pd.DataFrame()
 
-def fetch_balance_sheet_history(tickers):
+def _with_module(module, modules=None):
+    """The modules to request for a fetcher of module, always including module itself"""
+    if not modules:
+        return (module,)
+    modules = tuple(modules)
+    return modules if module in modules else (module,) + modules
+
+def _fetch_statements(tickers, module, statements_key, in_thousands=False, threads=None, backend='numpy', modules=None):
+    """Fetch one statement module for many tickers as line item x date DataFrames
+    
+    Args:
+        tickers (list): Validated ticker symbols
+        module (str): brapi module name, e.g. 'balanceSheetHistory'
+        statements_key (str): Key of the statement list inside the module
+        in_thousands (bool, optional): Divide values by 1000. Defaults to False.
+        threads (int, optional): Number of concurrent batches. Defaults to DEFAULT_THREADS.
+        backend (str, optional): 'numpy' or 'arrow' column dtypes. Defaults to 'numpy'.
+        modules (tuple, optional): Modules to request alongside module, e.g.
+            FUNDAMENTAL_MODULES to share one request. Defaults to module alone.
+        
+    Returns:
+        dict: DataFrames keyed by ticker, for tickers with statement data
+    """
+    results = {}
+    for ticker, payloads in _fetch_fundamentals(tickers, _with_module(module, modules), threads).items():
+        statements = payloads.get(module, {}).get(statements_key, [])
+        if statements:
+            results[ticker] = _statements_to_frame(statements, in_thousands, backend)
+    return results
+
+def _fetch_module_rows(tickers, module, threads=None, modules=None):
+    """Fetch a flat fundamentals module for many tickers as one dict per ticker
+    
+    Args:
+        tickers (list): Validated ticker symbols
+        module (str): brapi module name, e.g. 'summaryProfile'
+        threads (int, optional): Number of concurrent batches. Defaults to DEFAULT_THREADS.
+        modules (tuple, optional): Modules to request alongside module, e.g.
+            FUNDAMENTAL_MODULES to share one request. Defaults to module alone.
+        
+    Returns:
+        list: Module payloads with an added 'ticker' key, in input order
+    """
+    rows = []
+    for ticker, payloads in _fetch_fundamentals(tickers, _with_module(module, modules), threads).items():
+        row = payloads.get(module)
+        if row:
+            rows.append(dict(row, ticker=ticker))
+    return rows
+
+def fetch_balance_sheet_history(tickers, threads: Optional[int] = None, to_parquet_path: Optional[str] = None, backend: str = 'numpy', modules: Optional[tuple] = None):
     """Fetch balance sheet history for multiple tickers"""
     try:
-        if isinstance(tickers, str):    
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        results = {}
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'balanceSheetHistory'
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
+        tickers = _validate_tickers(tickers)
+        
+        # Convert to thousands for better readability
+        results = _fetch_statements(tickers, 'balanceSheetHistory', 'balanceSheetStatements',
+                                    in_thousands=True, threads=threads, backend=backend, modules=modules)
+        
+        if results and to_parquet_path:
+            _write_parquet(results, to_parquet_path)
             
-            if isinstance(response, dict):
-                balance_sheet_data = (response.get('balanceSheetHistory', {})
-                                    .get('balanceSheetStatements', []))
-                
-                if balance_sheet_data:
-                    data_dict = {}
-                    
-                    for statement in balance_sheet_data:
-                        if 'endDate' in statement:
-                            date = pd.to_datetime(statement['endDate']).strftime('%Y-%m-%d')
-                            
-                            for key, value in statement.items():
-                                if key != 'endDate':
-                                    if key not in data_dict:
-                                        data_dict[key] = {}
-                                    # Convert to thousands for better readability
-                                    data_dict[key][date] = value / 1000 if isinstance(value, (int, float)) else value
-                    
-                    df = pd.DataFrame(data_dict).transpose()
-                    df = df.apply(pd.to_numeric, errors='coerce')
-                    df = df.sort_index(axis=1)
-                    df.index = [idx.replace('_', ' ').title() for idx in df.index]
-                    
-                    # Format numbers to avoid scientific notation
-                    pd.options.display.float_format = '{:,.0f}'.format
-                    
-                    results[ticker] = df
-                    
         return results if results else None
         
-    except Exception as e:
-        logger.error(f"Error fetching balance sheet: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching balance sheet: %s", e)
         return None
 
-def fetch_income_statement_history(tickers):
+def fetch_income_statement_history(tickers, threads: Optional[int] = None, to_parquet_path: Optional[str] = None, backend: str = 'numpy', modules: Optional[tuple] = None):
     """Fetch annual income statement history for multiple tickers"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        results = {}
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'incomeStatementHistory'
-            }
+        tickers = _validate_tickers(tickers)
+        
+        results = _fetch_statements(tickers, 'incomeStatementHistory', 'incomeStatementHistory',
+                                    threads=threads, backend=backend, modules=modules)
+        
+        if results and to_parquet_path:
+            _write_parquet(results, to_parquet_path)
             
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
-                
-            if isinstance(response, dict):
-                income_stmt = (response.get('incomeStatementHistory', {})
-                             .get('incomeStatementHistory', []))
-                
-                if income_stmt:
-                    data_dict = {}
-                    
-                    for statement in income_stmt:
-                        if 'endDate' in statement:
-                            date = pd.to_datetime(statement['endDate']).strftime('%Y-%m-%d')
-                            
-                            for key, value in statement.items():
-                                if key != 'endDate':
-                                    if key not in data_dict:
-                                        data_dict[key] = {}
-                                    data_dict[key][date] = value
-                    
-                    df = pd.DataFrame(data_dict).transpose()
-                    df = df.apply(pd.to_numeric, errors='coerce')
-                    df = df.sort_index(axis=1)
-                    df.index = [idx.replace('_', ' ').title() for idx in df.index]
-                    
-                    results[ticker] = df
-                    
         return results if results else None
         
-    except Exception as e:
-        logger.error(f"Error fetching income statement: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching income statement: %s", e)
         return None
 
-def fetch_income_statement_history_quarterly(tickers):
+def fetch_income_statement_history_quarterly(tickers, threads: Optional[int] = None, to_parquet_path: Optional[str] = None, backend: str = 'numpy', modules: Optional[tuple] = None):
     """Fetch quarterly income statement history for multiple tickers"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        results = {}
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'incomeStatementHistoryQuarterly'
-            }
+        tickers = _validate_tickers(tickers)
+        
+        results = _fetch_statements(tickers, 'incomeStatementHistoryQuarterly', 'incomeStatementHistory',
+                                    threads=threads, backend=backend, modules=modules)
+        
+        if results and to_parquet_path:
+            _write_parquet(results, to_parquet_path)
             
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
-                
-            if isinstance(response, dict):
-                income_stmt = (response.get('incomeStatementHistoryQuarterly', {})
-                             .get('incomeStatementHistory', []))
-                
-                if income_stmt:
-                    data_dict = {}
-                    
-                    for statement in income_stmt:
-                        if 'endDate' in statement:
-                            date = pd.to_datetime(statement['endDate']).strftime('%Y-%m-%d')
-                            
-                            for key, value in statement.items():
-                                if key != 'endDate':
-                                    if key not in data_dict:
-                                        data_dict[key] = {}
-                                    data_dict[key][date] = value
-                    
-                    df = pd.DataFrame(data_dict).transpose()
-                    df = df.apply(pd.to_numeric, errors='coerce')
-                    df = df.sort_index(axis=1)
-                    df.index = [idx.replace('_', ' ').title() for idx in df.index]
-                    
-                    results[ticker] = df
-                    
         return results if results else None
         
-    except Exception as e:
-        logger.error(f"Error fetching quarterly income statement: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching quarterly income statement: %s", e)
         return None
 
-def fetch_balance_sheet_history_quarterly(tickers):
+def fetch_balance_sheet_history_quarterly(tickers, threads: Optional[int] = None, to_parquet_path: Optional[str] = None, backend: str = 'numpy', modules: Optional[tuple] = None):
     """Fetch quarterly balance sheet history for multiple tickers
     
     Args:
         tickers (str or list): Single ticker or list of ticker symbols
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
+        to_parquet_path (str, optional): Also write all results to this Parquet file
+        backend (str, optional): 'arrow' returns pyarrow-backed columns. Defaults to 'numpy'.
+        modules (tuple, optional): Extra modules for the same request, e.g.
+            FUNDAMENTAL_MODULES to share one cached response with the other
+            fundamentals fetchers. Defaults to this module alone.
         
     Returns:
         dict: Dictionary with tickers as keys and DataFrames as values (values in thousands)
     """
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        results = {}
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'balanceSheetHistoryQuarterly'
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
+        tickers = _validate_tickers(tickers)
+        
+        # Convert to thousands for better readability
+        results = _fetch_statements(tickers, 'balanceSheetHistoryQuarterly', 'balanceSheetStatements',
+                                    in_thousands=True, threads=threads, backend=backend, modules=modules)
+        
+        if results and to_parquet_path:
+            _write_parquet(results, to_parquet_path)
             
-            if isinstance(response, dict):
-                balance_sheet_data = (response.get('balanceSheetHistoryQuarterly', {})
-                                    .get('balanceSheetStatements', []))
-                
-                if balance_sheet_data:
-                    data_dict = {}
-                    
-                    for statement in balance_sheet_data:
-                        if 'endDate' in statement:
-                            date = pd.to_datetime(statement['endDate']).strftime('%Y-%m-%d')
-                            
-                            for key, value in statement.items():
-                                if key != 'endDate':
-                                    if key not in data_dict:
-                                        data_dict[key] = {}
-                                    # Convert to thousands for better readability
-                                    data_dict[key][date] = value / 1000 if isinstance(value, (int, float)) else value
-                    
-                    df = pd.DataFrame(data_dict).transpose()
-                    df = df.apply(pd.to_numeric, errors='coerce')
-                    df = df.sort_index(axis=1)
-                    df.index = [idx.replace('_', ' ').title() for idx in df.index]
-                    
-                    # Format numbers to avoid scientific notation
-                    pd.options.display.float_format = '{:,.0f}'.format
-                    
-                    results[ticker] = df
-                    
         return results if results else None
         
-    except Exception as e:
-        logger.error(f"Error fetching quarterly balance sheet: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching quarterly balance sheet: %s", e)
         return None
 
-def fetch_default_key_statistics(tickers):
+def fetch_default_key_statistics(tickers, threads: Optional[int] = None, backend: str = 'numpy', modules: Optional[tuple] = None):
     """Fetch key statistics for multiple tickers"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        all_stats = []
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'defaultKeyStatistics'
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
-                
-            if isinstance(response, dict):
-                stats = response.get('defaultKeyStatistics', {})
-                if stats:
-                    stats['ticker'] = ticker  # Add ticker column
-                    all_stats.append(stats)
+        tickers = _validate_tickers(tickers)
+        
+        all_stats = _fetch_module_rows(tickers, 'defaultKeyStatistics', threads, modules)
         
         if all_stats:
             df = pd.DataFrame(all_stats)
             df.set_index('ticker', inplace=True)
             
             # Convert numeric columns
-            for col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            df = df.apply(pd.to_numeric, errors='coerce')
+                
+            if backend == 'arrow':
+                df = df.astype('double[pyarrow]')
                 
             return df
             
         return None
         
-    except Exception as e:
-        logger.error(f"Error fetching key statistics: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching key statistics: %s", e)
         return None
 
-def fetch_financial_data(tickers):
+def fetch_financial_data(tickers, threads: Optional[int] = None, modules: Optional[tuple] = None):
     """Fetch financial data for multiple tickers"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        all_data = []
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'financialData'
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
-                
-            if isinstance(response, dict):
-                fin_data = response.get('financialData', {})
-                if fin_data:
-                    fin_data['ticker'] = ticker
-                    all_data.append(fin_data)
+        tickers = _validate_tickers(tickers)
+        
+        all_data = _fetch_module_rows(tickers, 'financialData', threads, modules)
         
         if all_data:
             df = pd.DataFrame(all_data)
             df.set_index('ticker', inplace=True)
             
             # Convert numeric columns preserving decimals
-            for col in df.columns:
-                try:
-                    df[col] = pd.to_numeric(df[col], errors='coerce', downcast=None)
-                except:
-                    continue
-                    
-            # Avoid scientific notation
-            pd.set_option('display.float_format', lambda x: '%.4f' % x if isinstance(x, float) else str(x))
+            df = df.apply(pd.to_numeric, errors='coerce')
                 
             return df
             
         return None
         
-    except Exception as e:
-        logger.error(f"Error fetching financial data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching financial data: %s", e)
         return None
 
-def fetch_summary_profile(tickers):
+def fetch_summary_profile(tickers, threads: Optional[int] = None, modules: Optional[tuple] = None):
     """Fetch company profile information for multiple tickers"""
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-        elif not isinstance(tickers, (list, tuple)):
-            raise ValueError(f"Expected string or list of tickers, got {type(tickers)}")
-            
-        all_profiles = []
-        for ticker in tickers:
-            if not isinstance(ticker, str):
-                logger.warning(f"Skipping invalid ticker: {ticker}")
-                continue
-                
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'fundamental': 'true',
-                'modules': 'summaryProfile'
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            if isinstance(response, list):
-                response = response[0] if response else {}
-                
-            if isinstance(response, dict):
-                profile = response.get('summaryProfile', {})
-                if profile:
-                    profile['ticker'] = ticker  # Add ticker column
-                    all_profiles.append(profile)
+        tickers = _validate_tickers(tickers)
+        
+        all_profiles = _fetch_module_rows(tickers, 'summaryProfile', threads, modules)
         
         if all_profiles:
             df = pd.DataFrame(all_profiles)
@@ -726,10 +1068,18 @@ def fetch_summary_profile(tickers):
             
         return None
         
-    except Exception as e:
-        logger.error(f"Error fetching company profiles: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching company profiles: %s", e)
         return None
 
+@cached(cache=_DEFAULT_RANGE_CACHE, lock=_CACHE_LOCK)
+def _default_range():
+    """Default (start, end) for the economic indicators: 3 years ago to yesterday, as 'dd/mm/YYYY'"""
+    now = datetime.now()
+    start = (now - timedelta(days=3 * 365)).strftime('%d/%m/%Y')
+    end = (now - timedelta(days=1)).strftime('%d/%m/%Y')
+    return start, end
+
 def fetch_inflation(start=None, end=None):
     """Fetch Brazilian inflation data
     
@@ -742,15 +1092,9 @@ def fetch_inflation(start=None, end=None):
     """
     try:
         # Set default dates if not provided
-        if start is None:
-            start = (datetime.now() - pd.DateOffset(years=3)).strftime('%d/%m/%Y')
-        else:
-            start = pd.to_datetime(start).strftime('%d/%m/%Y')
-            
-        if end is None:
-            end = (datetime.now() - pd.DateOffset(days=1)).strftime('%d/%m/%Y')
-        else:
-            end = pd.to_datetime(end).strftime('%d/%m/%Y')
+        default_start, default_end = _default_range()
+        start = default_start if start is None else pd.to_datetime(start).strftime('%d/%m/%Y')
+        end = default_end if end is None else pd.to_datetime(end).strftime('%d/%m/%Y')
         
         params = { 
             'country': 'brazil',
@@ -768,35 +1112,17 @@ def fetch_inflation(start=None, end=None):
             data = response if isinstance(response, list) else response.get('inflation', [])
             
             if data:
-                # Create DataFrame
-                df = pd.DataFrame(data)
-                
-                # Convert date to datetime
-                df['date'] = pd.to_datetime(df['date'], format='%d/%m/%Y')
-                
-                # Convert value to numeric, removing any % signs if present
-                df['value'] = df['value'].replace({'%': ''}, regex=True)
-                df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                
-                # Set date as index
-                df.set_index('date', inplace=True)
-                
-                # Sort index
-                df.sort_index(inplace=True)
-                
-                # Drop any duplicate indices, keeping the last value
-                df = df[~df.index.duplicated(keep='last')]
-                
-                # Drop epochDate column if it exists
-                if 'epochDate' in df.columns:
-                    df.drop('epochDate', axis=1, inplace=True)
+                # Index on the integer epochDate, one value per day
+                df = _indicator_frame(data)
+                if df is not None:
+                    df.index = df.index.tz_localize(None)
                 
                 return df
                 
         return None
         
-    except Exception as e:
-        logger.error(f"Error fetching inflation data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching inflation data: %s", e)
         return None
 
 def fetch_prime_rate(start=None, end=None):
@@ -811,15 +1137,9 @@ def fetch_prime_rate(start=None, end=None):
     """
     try:
         # Set default dates if not provided
-        if start is None:
-            start = (datetime.now() - pd.DateOffset(years=3)).strftime('%d/%m/%Y')
-        else:
-            start = pd.to_datetime(start).strftime('%d/%m/%Y')
-            
-        if end is None:
-            end = (datetime.now() - pd.DateOffset(days=1)).strftime('%d/%m/%Y')
-        else:
-            end = pd.to_datetime(end).strftime('%d/%m/%Y')
+        default_start, default_end = _default_range()
+        start = default_start if start is None else pd.to_datetime(start).strftime('%d/%m/%Y')
+        end = default_end if end is None else pd.to_datetime(end).strftime('%d/%m/%Y')
         
         params = {
             'country': 'brazil',
@@ -837,36 +1157,15 @@ def fetch_prime_rate(start=None, end=None):
             data = response if isinstance(response, list) else response.get('prime-rate', [])
             
             if data:
-                # Create DataFrame
-                df = pd.DataFrame(data)
-                
-                # Convert date to UTC datetime
-                df['date'] = pd.to_datetime(df['date'], format='%d/%m/%Y').dt.tz_localize('UTC')
-                
-                # Convert value to numeric, removing any % signs if present
-                df['value'] = df['value'].replace({'%': ''}, regex=True)
-                df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                
-                # Set date as index with proper name
-                df.set_index('date', inplace=True)
-                df.index.name = 'date'
-                
-                # Sort index
-                df.sort_index(inplace=True)
-                
-                # Drop any duplicate indices, keeping the last value
-                df = df[~df.index.duplicated(keep='last')]
-                
-                # Drop epochDate column if it exists
-                if 'epochDate' in df.columns:
-                    df.drop('epochDate', axis=1, inplace=True)
+                # Index on the integer epochDate, one value per day
+                df = _indicator_frame(data)
                 
                 return df
                 
         return None
         
-    except Exception as e:
-        print(f"Error fetching prime rate data: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching prime rate data: %s", e)
         return None
 
 def get_available_currencies(search=None):
@@ -911,220 +1210,269 @@ def get_available_countries(search=None):
         params['search'] = search
     return make_request('api/v2/inflation/available', params)
 
-def fetch_quote_open(tickers, range='1d', interval='1d'):
-    """Fetch open prices for multiple tickers
+def _parse_history(response):
+    """Parse the historicalDataPrice records of a quote response
+    
+    Args:
+        response (dict/list): Unwrapped api/quote response for one ticker
+        
+    Returns:
+        pd.DataFrame: OHLCV_FIELDS columns indexed by UTC date, None if there is no price data
+    """
+    if not response:
+        return None
+        
+    # Extract historical price data
+    historical_data = None
+    if isinstance(response, dict):
+        historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
+    elif isinstance(response, list) and response:
+        historical_data = response[0].get('historicalDataPrice', [])
+        
+    if not historical_data:
+        return None
+        
+    df = pd.DataFrame.from_records(historical_data, columns=list(_OHLCV_DTYPES), coerce_float=True)
+    df = _convert_prices(df)
+    # 'date' is already epoch seconds, view it as datetime64 instead of parsing
+    df.index = _epoch_seconds_index(df.pop('date'))
+    return df
+
+@cached(cache=_HISTORY_CACHE, lock=_CACHE_LOCK)
+def _fetch_historical(ticker_sa, range='1d', interval='1d'):
+    """Fetch and parse one ticker's OHLCV history, memoized for RESPONSE_CACHE_TTL
+    
+    Callers must not mutate the returned DataFrame, it is shared by the cache.
+    
+    Args:
+        ticker_sa (str): Ticker symbol with the '.SA' suffix
+        range (str): Time range
+        interval (str): Time interval
+        
+    Returns:
+        pd.DataFrame: OHLCV_FIELDS columns indexed by UTC date
+        
+    Raises:
+        _FailedResponse: If there is no price data, so failures are not cached
+    """
+    params = {
+        'range': range,
+        'interval': interval
+    }
+    
+    if ijson is not None and _is_long_history(range, interval):
+        # Long histories are streamed so the per-row dicts are never materialized
+        df = _stream_price_history(ticker_sa, params)
+        if df is None:
+            raise _FailedResponse(ticker_sa)
+        return _convert_prices(df.reindex(columns=OHLCV_FIELDS))
+        
+    # The parsed frame is cached by the caller, so skip the raw response cache
+    response = make_request(f'api/quote/{ticker_sa}', params, cache=False)
+    df = _parse_history(response)
+    if df is None:
+        raise _FailedResponse(ticker_sa)
+    return df
+
+def _fetch_historical_frames(tickers, range='1d', interval='1d', threads=None):
+    """Fetch the cached OHLCV history frame of each ticker concurrently
     
     Args:
         tickers (str or list): Single ticker or list of ticker symbols
-        range (str): Time range ('1d','5d','1mo','3mo','6mo','1y','2y','5y','10y','ytd','max')
-        interval (str): Time interval ('1m','2m','5m','15m','30m','60m','90m','1h','1d','5d','1wk','1mo','3mo')
+        range (str): Time range
+        interval (str): Time interval
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
         
     Returns:
-        pd.DataFrame: DataFrame with dates as index and tickers as columns containing open prices
+        dict: Shared (read-only) DataFrames by ticker, in input order, tickers
+            without data are left out
     """
-    try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-            
-        all_data = {}
-        for ticker in tickers:
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval
-            }
+    if isinstance(tickers, str):
+        tickers = [tickers]
+        
+    def _fetch_one(ticker):
+        try:
+            return _fetch_historical(_ensure_sa(ticker), range, interval)
+        except _FailedResponse:
+            return None
             
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            # Extract historical price data
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                df = pd.DataFrame(historical_data)
-                
-                # Convert date based on interval
-                intraday_intervals = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h']
-                df['date'] = pd.to_datetime(df['date'], unit='s', utc=True)
-                
-                # Select only open price and set date as index
-                df.set_index('date', inplace=True)
-                all_data[ticker] = df['open']
-                
-        if all_data:
-            df = pd.DataFrame(all_data)
-            return _convert_to_float64(df)
-        return pd.DataFrame()
+    return _fetch_concurrently(_fetch_one, tickers, threads)
+
+def _fetch_historical_batch(tickers, range='1d', interval='1d', threads=None):
+    """Fetch OHLCV history for many tickers as one (ticker, field) column frame
+    
+    Args:
+        tickers (str or list): Single ticker or list of ticker symbols
+        range (str): Time range
+        interval (str): Time interval
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
         
-    except Exception as e:
-        print(f"Error fetching open prices: {str(e)}")
+    Returns:
+        pd.DataFrame: Dates as index and a (ticker, field) MultiIndex as columns,
+            empty if no ticker returned data
+    """
+    frames = _fetch_historical_frames(tickers, range, interval, threads)
+    if not frames:
         return pd.DataFrame()
+    return pd.concat(frames, axis=1)
 
-def fetch_quote_high(tickers, range='1d', interval='1d'):
-    """Fetch high prices for multiple tickers"""
-    try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-            
-        all_data = {}
-        for ticker in tickers:
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                df = pd.DataFrame(historical_data)
-                df['date'] = pd.to_datetime(df['date'], unit='s', utc=True)
-                df.set_index('date', inplace=True)
-                all_data[ticker] = df['high']
-                
-        if all_data:
-            df = pd.DataFrame(all_data)
-            return _convert_to_float64(df)
-        return pd.DataFrame()
+def _align_field(frames, field):
+    """Assemble one field of per-ticker histories into a dates x tickers frame
+    
+    The union of dates is sorted once and each ticker's values are written
+    into a preallocated buffer by searchsorted, instead of aligning every
+    ticker's frame through pd.concat.
+    
+    Args:
+        frames (dict): OHLCV DataFrames by ticker, from _fetch_historical_frames
+        field (str): One of OHLCV_FIELDS
         
-    except Exception as e:
-        print(f"Error fetching high prices: {str(e)}")
-        return pd.DataFrame()
+    Returns:
+        pd.DataFrame: Dates as index and tickers as columns, at the field's _OHLCV_DTYPES dtype
+    """
+    stamps = [df.index.asi8 for df in frames.values()]
+    all_dates = np.unique(np.concatenate(stamps))
+    shape = (len(all_dates), len(frames))
+    dtype = _OHLCV_DTYPES[field]
+    nullable = dtype == 'Int64'
+    
+    if nullable:
+        out = np.zeros(shape, dtype='int64')
+        missing = np.ones(shape, dtype=bool)
+    else:
+        out = np.full(shape, np.nan, dtype=dtype)
+        
+    for i, (dates, df) in enumerate(zip(stamps, frames.values())):
+        rows = np.searchsorted(all_dates, dates)
+        values = df[field].array
+        if nullable:
+            out[rows, i] = values.to_numpy(dtype='int64', na_value=0)
+            missing[rows, i] = values.isna()
+        else:
+            out[rows, i] = values
+            
+    index = pd.DatetimeIndex(all_dates.view('datetime64[ns]'), tz='UTC', name='date')
+    if nullable:
+        columns = {ticker: pd.arrays.IntegerArray(out[:, i], missing[:, i]) for i, ticker in enumerate(frames)}
+        return pd.DataFrame(columns, index=index)
+    return pd.DataFrame(out, index=index, columns=list(frames))
 
-def fetch_quote_low(tickers, range='1d', interval='1d'):
-    """Fetch low prices for multiple tickers"""
+def fetch_quote_ohlcv(tickers, range='1d', interval='1d', fields=OHLCV_FIELDS, threads: Optional[int] = None):
+    """Fetch several price fields for multiple tickers with one request per ticker
+    
+    Args:
+        tickers (str or list): Single ticker or list of ticker symbols
+        range (str): Time range ('1d','5d','1mo','3mo','6mo','1y','2y','5y','10y','ytd','max')
+        interval (str): Time interval ('1m','2m','5m','15m','30m','60m','90m','1h','1d','5d','1wk','1mo','3mo')
+        fields (tuple): Fields to return, any of OHLCV_FIELDS
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
+        
+    Returns:
+        pd.DataFrame: DataFrame with dates as index and a (ticker, field) MultiIndex as columns
+    """
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-            
-        all_data = {}
-        for ticker in tickers:
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                df = pd.DataFrame(historical_data)
-                df['date'] = pd.to_datetime(df['date'], unit='s', utc=True)
-                df.set_index('date', inplace=True)
-                all_data[ticker] = df['low']
-                
-        if all_data:
-            df = pd.DataFrame(all_data)
-            return _convert_to_float64(df)
-        return pd.DataFrame()
+        df = _fetch_historical_batch(tickers, range, interval, threads)
+        if df.empty:
+            return pd.DataFrame()
+        df = df.loc[:, df.columns.get_level_values(1).isin(fields)]
+        return df
         
-    except Exception as e:
-        print(f"Error fetching low prices: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching OHLCV data: %s", e)
         return pd.DataFrame()
 
-def fetch_quote_close(tickers, range='1d', interval='1d'):
-    """Fetch close prices for multiple tickers"""
+def _fetch_quote_field(tickers, field, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch one price field for multiple tickers, shared by the fetch_quote_<field> wrappers
+    
+    Args:
+        tickers (str or list): Single ticker or list of ticker symbols
+        field (str): One of OHLCV_FIELDS
+        range (str): Time range ('1d','5d','1mo','3mo','6mo','1y','2y','5y','10y','ytd','max')
+        interval (str): Time interval ('1m','2m','5m','15m','30m','60m','90m','1h','1d','5d','1wk','1mo','3mo')
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
+        
+    Returns:
+        pd.DataFrame: DataFrame with dates as index and tickers as columns containing the field
+    """
     try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-            
-        all_data = {}
-        for ticker in tickers:
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                df = pd.DataFrame(historical_data)
-                df['date'] = pd.to_datetime(df['date'], unit='s', utc=True)
-                df.set_index('date', inplace=True)
-                all_data[ticker] = df['close']
-                
-        if all_data:
-            df = pd.DataFrame(all_data)
-            return _convert_to_float64(df)
-        return pd.DataFrame()
+        frames = _fetch_historical_frames(tickers, range, interval, threads)
+        if not frames:
+            return pd.DataFrame()
+        return _align_field(frames, field)
         
-    except Exception as e:
-        print(f"Error fetching close prices: {str(e)}")
+    except _FETCH_ERRORS as e:
+        logger.error("Error fetching %s data: %s", field, e)
         return pd.DataFrame()
 
-def fetch_quote_volume(tickers, range='1d', interval='1d'):
-    """Fetch volume data for multiple tickers"""
-    try:
-        if isinstance(tickers, str):
-            tickers = [tickers]
-            
-        all_data = {}
-        for ticker in tickers:
-            ticker_sa = ticker.replace('.SA', '') + '.SA'
-            
-            params = {
-                'range': range,
-                'interval': interval
-            }
-            
-            response = make_request(f'api/quote/{ticker_sa}', params)
-            if not response:
-                continue
-                
-            historical_data = None
-            if isinstance(response, dict):
-                historical_data = response.get('results', [{}])[0].get('historicalDataPrice', [])
-            elif isinstance(response, list) and response:
-                historical_data = response[0].get('historicalDataPrice', [])
-                
-            if historical_data:
-                df = pd.DataFrame(historical_data)
-                df['date'] = pd.to_datetime(df['date'], unit='s', utc=True)
-                df.set_index('date', inplace=True)
-                all_data[ticker] = df['volume']
-                
-        if all_data:
-            df = pd.DataFrame(all_data)
-            return _convert_to_float64(df)
-        return pd.DataFrame()
+def fetch_quote_open(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch open prices for multiple tickers
+    
+    Args:
+        tickers (str or list): Single ticker or list of ticker symbols
+        range (str): Time range ('1d','5d','1mo','3mo','6mo','1y','2y','5y','10y','ytd','max')
+        interval (str): Time interval ('1m','2m','5m','15m','30m','60m','90m','1h','1d','5d','1wk','1mo','3mo')
+        threads (int, optional): Number of concurrent requests. Defaults to DEFAULT_THREADS.
         
-    except Exception as e:
-        print(f"Error fetching volume data: {str(e)}")
-        return pd.DataFrame()
+    Returns:
+        pd.DataFrame: DataFrame with dates as index and tickers as columns containing open prices
+    """
+    return _fetch_quote_field(tickers, 'open', range, interval, threads)
+
+def fetch_quote_high(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch high prices for multiple tickers"""
+    return _fetch_quote_field(tickers, 'high', range, interval, threads)
+
+def fetch_quote_low(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch low prices for multiple tickers"""
+    return _fetch_quote_field(tickers, 'low', range, interval, threads)
+
+def fetch_quote_close(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch close prices for multiple tickers"""
+    return _fetch_quote_field(tickers, 'close', range, interval, threads)
+
+def fetch_quote_volume(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch volume data for multiple tickers"""
+    return _fetch_quote_field(tickers, 'volume', range, interval, threads)
+
+def _ffill_align_py(src_ts, src_vals, dst_ts, out):
+    """Forward-fill src_vals rows onto dst_ts, compiled by _load_ffill_align
+    
+    src_ts and dst_ts are sorted int64 epochs in the same unit. out[i, c]
+    is the last src_vals[j, c] with src_ts[j] <= dst_ts[i], NaN before
+    the first source row.
+    """
+    for c in range(src_vals.shape[1]):
+        j = 0
+        last = np.nan
+        for i in range(dst_ts.size):
+            while j < src_ts.size and src_ts[j] <= dst_ts[i]:
+                last = src_vals[j, c]
+                j += 1
+            out[i, c] = last
+
+# Compiled _ffill_align_py, None until first use and False without numba
+_ffill_align = None
+
+def _load_ffill_align():
+    """Import numba and compile the forward-fill kernel on first use
+    
+    numba is optional and slow to import, so it is only loaded once
+    extract_common_stock_data needs it. The kernel is serial: it spans a
+    handful of ticker columns, and parallel kernels crash under numba's
+    workqueue threading layer when called from several threads.
+    
+    Returns:
+        callable: The compiled kernel, None if numba is not installed
+    """
+    global _ffill_align
+    if _ffill_align is None:
+        try:
+            import numba
+        except ImportError:
+            _ffill_align = False
+        else:
+            _ffill_align = numba.njit(cache=True)(_ffill_align_py)
+    return _ffill_align or None
 
 def extract_common_stock_data(bs_data_dict, stock_data_df):
     """Extract common stock data from balance sheet data and align with stock price dates
@@ -1137,78 +1485,64 @@ def extract_common_stock_data(bs_data_dict, stock_data_df):
         pd.DataFrame: DataFrame with common stock values aligned by date, tickers as columns
     """
     try:
-        # Initialize dictionary to store common stock data
+        # Collect the raw common stock row of each ticker
         common_stock_data = {}
         
+        # Key results in the same ticker format as stock_data_df, decided once
+        with_sa = '.SA' in stock_data_df.columns[0]
+        
         # Process each ticker's balance sheet data
         for ticker, bs_df in bs_data_dict.items():
-            # Remove .SA suffix for matching if present
-            clean_ticker = ticker.replace('.SA', '')
-            
-            # Check for variations of "Common Stock" in index
-            possible_names = ['Commonstock', 'Common Stock', 'CommonStock']
-            stock_row = None
-            for name in possible_names:
-                if name in bs_df.index:
-                    stock_row = name
-                    break
-                    
-            if stock_row is None:
-                print(f"No common stock data found for {ticker}")
+            # Match any spelling of "Common Stock" ('Commonstock', 'CommonStock', ...)
+            mask = bs_df.index.astype(str).str.replace(' ', '').str.lower() == 'commonstock'
+            if not mask.any():
+                logger.warning("No common stock data found for %s", ticker)
                 continue
                 
-            # Extract common stock series and clean data
-            common_stock_series = bs_df.loc[stock_row]
-            
-            # Convert values to float64, removing any formatting
-            if isinstance(common_stock_series, pd.Series):
-                common_stock_series = pd.to_numeric(
-                    common_stock_series.astype(str).str.replace(',', ''), 
-                    errors='coerce'
-                ).astype('float64')
+            ticker_key = _ensure_sa(ticker) if with_sa else ticker.removesuffix('.SA')
+            common_stock_data[ticker_key] = bs_df.loc[mask].iloc[0]
             
-            # Convert index to datetime and localize to UTC
-            common_stock_series.index = pd.to_datetime(common_stock_series.index)
-            if common_stock_series.index.tz is None:
-                common_stock_series.index = common_stock_series.index.tz_localize('UTC')
-            
-            # Store in dictionary using the same ticker format as stock_data_df
-            ticker_key = f"{clean_ticker}.SA" if '.SA' in stock_data_df.columns[0] else clean_ticker
-            common_stock_data[ticker_key] = common_stock_series
-        
         if not common_stock_data:
-            print("No common stock data found for any ticker")
+            logger.warning("No common stock data found for any ticker")
             return pd.DataFrame()
             
-        # Create DataFrame from all series
-        result_df = pd.DataFrame(common_stock_data)
+        # Build all columns at once, then clean and convert the whole frame
+        result_df = pd.concat(common_stock_data, axis=1)
+        result_df = result_df.replace(',', '', regex=True)
+        result_df = result_df.apply(pd.to_numeric, errors='coerce').astype('float64')
+        
+        # Statement dates as UTC, matching the price index
+        result_df.index = pd.to_datetime(result_df.index, utc=True)
         
         # Ensure all columns match stock_data_df
         result_df = result_df[stock_data_df.columns]
         
-        # Sort index
-        result_df.sort_index(inplace=True)
-        
-        # Reindex to match stock_data_df dates and forward fill
-        result_df = result_df.reindex(stock_data_df.index, method='ffill')
-        
-        # Ensure all values are float64
-        result_df = result_df.astype('float64')
+        # Sort, then reindex to match stock_data_df dates and forward fill
+        result_df = result_df.sort_index()
+        price_index = stock_data_df.index
+        # The kernel compares UTC epochs, so only take it for a sorted tz-aware
+        # DatetimeIndex, anything else goes through reindex and its checks
+        use_kernel = (isinstance(price_index, pd.DatetimeIndex) and price_index.tz is not None
+                      and price_index.is_monotonic_increasing)
+        ffill_align = _load_ffill_align() if use_kernel else None
+        if ffill_align is not None:
+            out = np.empty((len(price_index), result_df.shape[1]))
+            ffill_align(result_df.index.as_unit('ns').asi8, result_df.to_numpy(dtype='float64'),
+                         price_index.as_unit('ns').asi8, out)
+            result_df = pd.DataFrame(out, index=price_index, columns=result_df.columns)
+        else:
+            result_df = result_df.reindex(price_index, method='ffill')
         
-        # Print debug information
-        print(f"\nData Summary:")
-        print(f"Dates range: {result_df.index.min()} to {result_df.index.max()}")
-        print(f"Columns (tickers): {result_df.columns.tolist()}")
-        print(f"Data types: {result_df.dtypes.unique()}")
-        print(f"\nSample data:")
-        print(result_df.head())
+        # Log debug information
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dates range: %s to %s", result_df.index.min(), result_df.index.max())
+            logger.debug("Columns (tickers): %s", result_df.columns.tolist())
+            logger.debug("Data types: %s", result_df.dtypes.unique())
+            logger.debug("Sample data:\n%s", result_df.head())
         
         return result_df
         
-    except Exception as e:
-        print(f"Error extracting common stock data: {str(e)}")
-        print(f"Error details: {str(e.__class__.__name__)}")
-        import traceback
-        traceback.print_exc()
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.exception("Error extracting common stock data")
         return pd.DataFrame()
 
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+import pandas as pd
+
+from brapi_wrapper import (
+    API_KEY,
+    BASE_URL,
+    REQUEST_TIMEOUT,
+    _FETCH_ERRORS,
+    _align_field,
+    _ensure_sa,
+    _parse_history,
+    _parse_quote_entry,
+    _unwrap_response,
+    _validate_tickers,
+)
+
+logger = logging.getLogger(__name__)
+
+# Errors the async fetchers log and turn into an empty result
+_ASYNC_FETCH_ERRORS = _FETCH_ERRORS + (httpx.HTTPError,)
+
+# Concurrent streams are multiplexed over these HTTP/2 connections
+ASYNC_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+def _async_client():
+    """Build an HTTP/2 client for one batch of concurrent requests
+
+    A client is created per call rather than at module level because its
+    connection pool is bound to the event loop that first uses it.
+    """
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=True,
+        limits=ASYNC_LIMITS,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+        headers={'Accept-Encoding': 'gzip'}
+    )
+
+async def make_request_async(client, endpoint, params=None):
+    """Make a request to the Brapi API on an async client
+
+    Args:
+        client (httpx.AsyncClient): Client from _async_client()
+        endpoint (str): API endpoint path
+        params (dict, optional): Query parameters. Defaults to None.
+
+    Returns:
+        dict/list: API response data if successful, None if failed
+    """
+    params = dict(params or {})
+    if API_KEY:
+        params['token'] = API_KEY
+
+    try:
+        response = await client.get(endpoint, params=params)
+        return _unwrap_response(endpoint, response)
+    except httpx.HTTPError as e:
+        logger.error("Request error for %s: %s", endpoint, e)
+        return None
+
+async def _gather_by_ticker(tickers, coros):
+    """Await one coroutine per ticker, isolating failures like the threaded path
+    
+    A ticker whose coroutine raises is logged and left out, so it does not
+    discard the results of the others.
+    
+    Returns:
+        dict: Results by ticker, in input order, for tickers that returned data
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    fetched = {}
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, Exception):
+            logger.error("Error fetching data for %s", ticker, exc_info=result)
+        elif isinstance(result, BaseException):
+            raise result
+        elif result is not None:
+            fetched[ticker] = result
+    return fetched
+
+def _run(coro):
+    """Run a coroutine from synchronous code with asyncio.run
+    
+    asyncio.run cannot start inside an already running event loop (Jupyter,
+    FastAPI handlers), so there the blocking wrappers raise and the *_async
+    function has to be awaited instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    coro.close()
+    raise RuntimeError("Called from a running event loop, await the *_async function instead")
+
+async def fetch_quote_async(tickers, range='1d', interval='1d', fundamental=False, dividends=False, modules=None):
+    """Fetch quote data for many tickers concurrently over HTTP/2
+
+    Same arguments and return value as brapi_wrapper.fetch_quote.
+    """
+    try:
+        single = isinstance(tickers, str) or (isinstance(tickers, (list, tuple)) and len(tickers) == 1)
+        tickers = _validate_tickers(tickers)
+
+        params = {
+            'range': range,
+            'interval': interval,
+            'fundamental': str(fundamental).lower(),
+            'dividends': str(dividends).lower()
+        }
+
+        if modules:
+            params['modules'] = modules
+
+        async with _async_client() as client:
+            async def _one(ticker):
+                response = await make_request_async(client, f'api/quote/{_ensure_sa(ticker)}', params)
+                if not response:
+                    return None
+
+                entry = response[0] if isinstance(response, list) else response
+                if not isinstance(entry, dict):
+                    return None
+
+                return _parse_quote_entry(entry, fundamental, dividends)
+
+            results = await _gather_by_ticker(tickers, [_one(ticker) for ticker in tickers])
+
+        if single:
+            return results.get(tickers[0]) if tickers else None
+        return results
+
+    except _ASYNC_FETCH_ERRORS as e:
+        logger.error("Error fetching quote data: %s", e)
+        return None
+
+def fetch_quote(tickers, range='1d', interval='1d', fundamental=False, dividends=False, modules=None):
+    """Blocking wrapper around fetch_quote_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_async(tickers, range, interval, fundamental, dividends, modules))
+
+async def _fetch_history_async(client, ticker, params):
+    """Fetch and parse one ticker's OHLCV history, None if it has no price data"""
+    response = await make_request_async(client, f'api/quote/{_ensure_sa(ticker)}', params)
+    return _parse_history(response)
+
+async def _fetch_quote_field_async(tickers, field, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch one price field for many tickers over a single HTTP/2 client
+    
+    Same arguments and return value as brapi_wrapper._fetch_quote_field,
+    threads bounds the number of requests in flight at once.
+    """
+    try:
+        if isinstance(tickers, str):
+            tickers = [tickers]
+            
+        params = {
+            'range': range,
+            'interval': interval
+        }
+        limit = asyncio.Semaphore(threads or len(tickers) or 1)
+        
+        async with _async_client() as client:
+            async def _one(ticker):
+                async with limit:
+                    return await _fetch_history_async(client, ticker, params)
+                    
+            frames = await _gather_by_ticker(tickers, [_one(ticker) for ticker in tickers])
+            
+        if not frames:
+            return pd.DataFrame()
+        return _align_field(frames, field)
+        
+    except _ASYNC_FETCH_ERRORS as e:
+        logger.error("Error fetching %s data: %s", field, e)
+        return pd.DataFrame()
+
+async def fetch_quote_open_async(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch open prices for multiple tickers concurrently over HTTP/2"""
+    return await _fetch_quote_field_async(tickers, 'open', range, interval, threads)
+
+async def fetch_quote_high_async(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch high prices for multiple tickers concurrently over HTTP/2"""
+    return await _fetch_quote_field_async(tickers, 'high', range, interval, threads)
+
+async def fetch_quote_low_async(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch low prices for multiple tickers concurrently over HTTP/2"""
+    return await _fetch_quote_field_async(tickers, 'low', range, interval, threads)
+
+async def fetch_quote_close_async(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch close prices for multiple tickers concurrently over HTTP/2"""
+    return await _fetch_quote_field_async(tickers, 'close', range, interval, threads)
+
+async def fetch_quote_volume_async(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Fetch volume data for multiple tickers concurrently over HTTP/2"""
+    return await _fetch_quote_field_async(tickers, 'volume', range, interval, threads)
+
+def fetch_quote_open(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Blocking wrapper around fetch_quote_open_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_open_async(tickers, range, interval, threads))
+
+def fetch_quote_high(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Blocking wrapper around fetch_quote_high_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_high_async(tickers, range, interval, threads))
+
+def fetch_quote_low(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Blocking wrapper around fetch_quote_low_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_low_async(tickers, range, interval, threads))
+
+def fetch_quote_close(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Blocking wrapper around fetch_quote_close_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_close_async(tickers, range, interval, threads))
+
+def fetch_quote_volume(tickers, range='1d', interval='1d', threads: Optional[int] = None):
+    """Blocking wrapper around fetch_quote_volume_async, raises RuntimeError inside a running event loop"""
+    return _run(fetch_quote_volume_async(tickers, range, interval, threads))
@@ -0,0 +1,34 @@
+"""Generate src/_schema_cache.py from openai_tools_schema.json
+
+Run after editing the JSON schema:
+
+    python scripts/gen_schema.py
+
+src/tools.py and integrate_openai.py import FUNCTIONS from the generated
+module, which is byte-compiled once. The module records the SHA-256 of the
+JSON it was built from, and both fall back to parsing the JSON when it is
+absent or its hash no longer matches.
+"""
+import hashlib
+import json
+import os
+import pprint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT, 'openai_tools_schema.json')
+CACHE_PATH = os.path.join(ROOT, 'src', '_schema_cache.py')
+
+def main():
+    with open(SCHEMA_PATH, 'rb') as f:
+        schema_bytes = f.read()
+    functions = tuple(json.loads(schema_bytes)['functions'])
+
+    with open(CACHE_PATH, 'w') as f:
+        f.write('# Generated by scripts/gen_schema.py from openai_tools_schema.json, do not edit\n')
+        f.write(f"SCHEMA_SHA256 = '{hashlib.sha256(schema_bytes).hexdigest()}'\n")
+        f.write(f'FUNCTIONS = {pprint.pformat(functions, sort_dicts=False)}\n')
+
+    print(f"Wrote {len(functions)} functions to {CACHE_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from .tools import execute_function
 from dotenv import load_dotenv
 import os
 
@@ -9,6 +8,12 @@ load_dotenv()
 
 app = FastAPI()
 
+@app.on_event("startup")
+def load_tools():
+    # Import the wrapper and schema on startup, not when the module is imported
+    from .tools import execute_function
+    app.state.execute_function = execute_function
+
 class FunctionCall(BaseModel):
     function_name: str
     parameters: dict
@@ -16,7 +21,7 @@ class FunctionCall(BaseModel):
 @app.post("/execute")
 async def execute(function_call: FunctionCall):
     try:
-        result = execute_function(function_call.function_name, function_call.parameters)
+        result = app.state.execute_function(function_call.function_name, function_call.parameters)
         return {"result": result}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
\ No newline at end of file
@@ -1,22 +1,38 @@
+import hashlib
 import json
 import sys
 import os
+import types
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from brapi_wrapper import *
+import brapi_wrapper as bw
 
-# Load the JSON schema
+# Load the schema from the module generated by scripts/gen_schema.py, or parse
+# the JSON when that module is missing or was generated from another version of it
+try:
+    from ._schema_cache import FUNCTIONS, SCHEMA_SHA256
+except ImportError:
+    FUNCTIONS = SCHEMA_SHA256 = None
 schema_path = os.path.join(os.path.dirname(__file__), '..', 'openai_tools_schema.json')
-with open(schema_path) as f:
-    tools_schema = json.load(f)
+if FUNCTIONS is None or os.path.exists(schema_path):
+    with open(schema_path, 'rb') as f:
+        _schema_bytes = f.read()
+    if SCHEMA_SHA256 != hashlib.sha256(_schema_bytes).hexdigest():
+        FUNCTIONS = tuple(json.loads(_schema_bytes)['functions'])
 
-# Create a mapping from function names to actual functions
-FUNCTIONS_MAP = {func['name']: globals()[func['name']] for func in tools_schema['functions']}
+# Fail once at import if the schema names a function the wrapper does not define
+_schema_names = [func['name'] for func in FUNCTIONS]
+_missing = [name for name in _schema_names if not callable(getattr(bw, name, None))]
+if _missing:
+    raise ImportError(f"Schema functions not found in brapi_wrapper: {', '.join(_missing)}")
+
+# Read-only mapping from function names to actual functions
+FUNCTIONS_MAP = types.MappingProxyType({name: getattr(bw, name) for name in _schema_names})
 
 def execute_function(function_name, parameters):
     func = FUNCTIONS_MAP.get(function_name)
     if not func:
         raise ValueError(f"Function '{function_name}' not found.")
-    return func(**parameters) 
\ No newline at end of file
+    return func(**parameters)
\ No newline at end of file
@@ -0,0 +1,93 @@
+import json
+import os
+import re
+import sys
+
+import pytest
+import responses
+
+# Add the project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import brapi_wrapper
+
+# Canned quote payload, one copy is returned per requested symbol
+SAMPLE_QUOTE_JSON = {
+    'currency': 'BRL',
+    'regularMarketPrice': 38.5,
+    'historicalDataPrice': [
+        {'date': 1700000000, 'open': 37.1, 'high': 38.0, 'low': 36.9, 'close': 37.8, 'volume': 41000000, 'adjustedClose': 37.8},
+        {'date': 1700086400, 'open': 37.8, 'high': 38.9, 'low': 37.5, 'close': 38.5, 'volume': 39500000, 'adjustedClose': 38.5},
+    ],
+    'balanceSheetHistory': {'balanceSheetStatements': [
+        {'endDate': '2023-12-31T00:00:00.000Z', 'totalAssets': 1050000000, 'commonStock': 205431000},
+        {'endDate': '2022-12-31T00:00:00.000Z', 'totalAssets': 976000000, 'commonStock': 205431000},
+    ]},
+    'balanceSheetHistoryQuarterly': {'balanceSheetStatements': [
+        {'endDate': '2023-12-31T00:00:00.000Z', 'totalAssets': 1050000000, 'commonStock': 205431000},
+    ]},
+    'incomeStatementHistory': {'incomeStatementHistory': [
+        {'endDate': '2023-12-31T00:00:00.000Z', 'totalRevenue': 511994000, 'netIncome': 124606000},
+    ]},
+    'incomeStatementHistoryQuarterly': {'incomeStatementHistory': [
+        {'endDate': '2023-12-31T00:00:00.000Z', 'totalRevenue': 133216000, 'netIncome': 30903000},
+    ]},
+    'defaultKeyStatistics': {'beta': 1.21, 'sharesOutstanding': 13044496000},
+    'financialData': {'currentPrice': 38.5, 'financialCurrency': 'BRL'},
+    'summaryProfile': {'sector': 'Energy', 'city': 'Rio de Janeiro'},
+}
+
+SAMPLE_QUOTE_LIST_JSON = {
+    'stocks': [
+        {'stock': 'VALE3', 'name': 'VALE ON NM', 'close': 68.2, 'change': -0.4, 'volume': 21000000, 'market_cap': 305000000000, 'sector': 'Non-Energy Minerals'},
+        {'stock': 'PETR4', 'name': 'PETROBRAS PN', 'close': 38.5, 'change': 1.1, 'volume': 39500000, 'market_cap': 502000000000, 'sector': 'Energy Minerals'},
+    ]
+}
+
+# Newest first, as the API sorts them, with one day reported twice and one
+# record missing its epochDate
+SAMPLE_PRIME_RATE_JSON = {
+    'prime-rate': [
+        {'date': '01/03/2024', 'value': '10.75', 'epochDate': None},
+        {'date': '01/02/2024', 'value': '11.25%', 'epochDate': 1706756400000},
+        {'date': '01/01/2024', 'value': '11.65', 'epochDate': 1704078000000},
+        {'date': '01/01/2024', 'value': '11.75', 'epochDate': 1704078000000},
+    ]
+}
+
+def _quote_callback(request):
+    """Reply to api/quote/{symbols} with one result per symbol, 404 for unknown ones"""
+    symbols = request.path_url.split('?')[0].rsplit('/', 1)[-1].split(',')
+    if any(symbol.upper().startswith('INVALID') for symbol in symbols):
+        return 404, {}, json.dumps({'error': True, 'message': 'Not Found'})
+    results = [dict(SAMPLE_QUOTE_JSON, symbol=symbol.replace('.SA', '')) for symbol in symbols]
+    return 200, {}, json.dumps({'results': results})
+
+@pytest.fixture(scope='session')
+def mock_brapi():
+    """Replay canned BRAPI payloads for the whole session instead of hitting the network"""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, re.compile(r'.*brapi.*/api/quote/list.*'), json=SAMPLE_QUOTE_LIST_JSON)
+        rsps.add_callback(responses.GET, re.compile(r'.*brapi.*/api/quote/(?!list)[^/?]+.*'), callback=_quote_callback)
+        rsps.add(responses.GET, re.compile(r'.*brapi.*/api/v2/prime-rate.*'), json=SAMPLE_PRIME_RATE_JSON)
+        yield rsps
+
+@pytest.fixture(autouse=True)
+def offline(request):
+    """Route every test that is not marked live through mock_brapi"""
+    if 'live' not in request.keywords:
+        request.getfixturevalue('mock_brapi')
+    yield
+    brapi_wrapper.clear_cache()
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'live: test calls the real BRAPI API, run with -m live')
+
+def pytest_collection_modifyitems(config, items):
+    # Live tests only run when explicitly selected with -m live
+    if 'live' in (config.option.markexpr or ''):
+        return
+    skip_live = pytest.mark.skip(reason='calls the real BRAPI API, run with -m live')
+    for item in items:
+        if 'live' in item.keywords:
+            item.add_marker(skip_live)
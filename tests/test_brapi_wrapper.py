@@ -1,22 +1,269 @@
-import unittest
-from brapi_wrapper import fetch_quote
-
-class TestBrapiWrapper(unittest.TestCase):
-    def test_fetch_quote_single_ticker(self):
-        result = fetch_quote(tickers=["AAPL"])
-        self.assertIsNotNone(result)
-        self.assertIn("AAPL", result)
-
-    def test_fetch_quote_multiple_tickers(self):
-        result = fetch_quote(tickers=["AAPL", "GOOGL"])
-        self.assertIsNotNone(result)
-        self.assertIn("AAPL", result)
-        self.assertIn("GOOGL", result)
-
-    def test_fetch_quote_invalid_ticker(self):
-        result = fetch_quote(tickers=["INVALID"])
-        self.assertIsNotNone(result)
-        self.assertNotIn("INVALID", result)
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+import responses
+import brapi_wrapper
+from brapi_wrapper import (
+    fetch_quote,
+    fetch_balance_sheet_history,
+    fetch_income_statement_history,
+    fetch_income_statement_history_quarterly,
+    fetch_balance_sheet_history_quarterly,
+    fetch_default_key_statistics,
+    fetch_financial_data,
+    fetch_summary_profile,
+    fetch_quote_list,
+    fetch_available_tickers,
+    fetch_quote_close,
+    fetch_quote_volume,
+    fetch_prime_rate
+)
+from conftest import SAMPLE_QUOTE_JSON
+
+TEST_TICKER = 'PETR4.SA'
+TEST_TICKERS = ['PETR4.SA', 'VALE3.SA']
+
+def test_fetch_quote():
+    """Test fetching quote data"""
+    # Test single ticker
+    result = fetch_quote(TEST_TICKER)
+    assert result is not None
+    assert isinstance(result, pd.DataFrame)
+    assert 'close' in result.columns
+
+    # Test multiple tickers
+    results = fetch_quote(TEST_TICKERS)
+    assert results is not None
+    assert isinstance(results, dict)
+    assert len(results) == len(TEST_TICKERS)
+
+@pytest.mark.parametrize('fetch', [
+    fetch_balance_sheet_history,
+    fetch_income_statement_history,
+    fetch_income_statement_history_quarterly,
+    fetch_balance_sheet_history_quarterly,
+])
+def test_fetch_statement_history(fetch):
+    """Test fetching yearly and quarterly statement histories"""
+    result = fetch(TEST_TICKER)
+    assert result is not None
+    assert isinstance(result, dict)
+    assert TEST_TICKER in result
+
+    df = result[TEST_TICKER]
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) > 0
+
+@pytest.mark.parametrize('fetch', [
+    fetch_default_key_statistics,
+    fetch_financial_data,
+    fetch_summary_profile,
+])
+def test_fetch_module_rows(fetch):
+    """Test fetching key statistics, financial data and company profile"""
+    result = fetch(TEST_TICKER)
+    assert result is not None
+    assert isinstance(result, pd.DataFrame)
+    assert TEST_TICKER in result.index
+
+def test_fundamentals_request_only_their_module(mock_brapi):
+    """Test that each fundamentals fetcher requests its own module unless asked to share one request"""
+    start = len(mock_brapi.calls)
+    fetch_summary_profile(TEST_TICKER)
+    assert [call.request.params['modules'] for call in mock_brapi.calls[start:]] == ['summaryProfile']
+
+    start = len(mock_brapi.calls)
+    shared = brapi_wrapper.FUNDAMENTAL_MODULES
+    assert fetch_financial_data(TEST_TICKER, modules=shared) is not None
+    assert fetch_balance_sheet_history(TEST_TICKER, modules=shared) is not None
+    assert len(mock_brapi.calls) == start + 1
+
+def test_fetch_quote_list():
+    """Test fetching quote list"""
+    result = fetch_quote_list()
+    assert result is not None
+    assert isinstance(result, dict)
+    assert 'stocks' in result
+    assert isinstance(result['stocks'], pd.DataFrame)
+
+def test_fetch_available_tickers():
+    """Test fetching available tickers"""
+    result = fetch_available_tickers()
+    assert result is not None
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) > 0
+
+def test_error_handling():
+    """Test error handling with invalid inputs"""
+    # Test with invalid ticker
+    result = fetch_quote('INVALID')
+    assert result is None
+
+    # Test with invalid type, logged and returned as None like every other fetcher
+    assert fetch_quote(123) is None
+
+def test_data_validation():
+    """Test data validation and cleaning"""
+    result = fetch_quote(TEST_TICKER)
+    assert result is not None
+
+    # Check for NaN values
+    assert not result['close'].isnull().all()
+
+    # Check date index
+    assert pd.api.types.is_datetime64_any_dtype(result.index)
+
+def test_fetch_quote_fields():
+    """Test per-field price frames and their dtypes"""
+    close = fetch_quote_close(TEST_TICKERS)
+    assert list(close.columns) == TEST_TICKERS
+    assert (close.dtypes == 'float32').all()
+    assert str(close.index.tz) == 'UTC'
+
+    volume = fetch_quote_volume(TEST_TICKER)
+    assert (volume.dtypes == 'Int64').all()
+
+def test_fetch_prime_rate():
+    """Test prime rate parsing, one value per day on a sorted UTC index, skipping records without epochDate"""
+    result = fetch_prime_rate()
+    assert list(result.index.strftime('%Y-%m-%d')) == ['2024-01-01', '2024-02-01']
+    assert str(result.index.tz) == 'UTC'
+    assert result['value'].tolist() == [11.75, 11.25]
+
+    # A series with no usable epochDate at all is no data rather than an error
+    assert brapi_wrapper._indicator_frame([{'value': '11', 'epochDate': None}]) is None
+
+def test_batched_quotes_match_symbols_case_insensitively():
+    """Test that batch results are matched back to lower-case and mixed '.SA' input, and omissions retried"""
+    def _upper_callback(request):
+        # Echo symbols in upper case, and leave VALE3 out of multi-symbol batches
+        symbols = request.path_url.split('?')[0].rsplit('/', 1)[-1].split(',')
+        results = [dict(SAMPLE_QUOTE_JSON, symbol=symbol.upper().replace('.SA', '')) for symbol in symbols
+                   if len(symbols) == 1 or not symbol.upper().startswith('VALE3')]
+        return 200, {}, json.dumps({'results': results})
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add_callback(responses.GET, re.compile(r'.*brapi.*/api/quote/.*'), callback=_upper_callback)
+        assert list(fetch_quote(['petr4', 'vale3'])) == ['petr4', 'vale3']
+        assert list(fetch_quote(['PETR4', 'PETR4.SA', 'VALE3'])) == ['PETR4', 'PETR4.SA', 'VALE3']
+        assert list(fetch_summary_profile(['petr4', 'vale3']).index) == ['petr4', 'vale3']
+
+def test_fetch_quote_field_isolates_failing_ticker(monkeypatch):
+    """Test that one ticker's unexpected error does not drop the rest of the batch"""
+    fetch_historical = brapi_wrapper._fetch_historical
+
+    def _fetch_historical(ticker_sa, range='1d', interval='1d'):
+        if ticker_sa.startswith('MALFORMED'):
+            raise RuntimeError('malformed payload')
+        return fetch_historical(ticker_sa, range, interval)
+
+    monkeypatch.setattr(brapi_wrapper, '_fetch_historical', _fetch_historical)
+    close = fetch_quote_close(['PETR4.SA', 'MALFORMED', 'VALE3.SA'])
+    assert list(close.columns) == TEST_TICKERS
+
+def test_statement_backends_agree():
+    """Test that the numpy and arrow backends parse the same payload to the same values"""
+    statements = [
+        {'endDate': '2023-12-31T00:00:00.000Z', 'totalAssets': '1050000000', 'commonStock': 205431000, 'currency': 'BRL'},
+        {'endDate': '2022-12-31T00:00:00.000Z', 'totalAssets': 976000000, 'commonStock': 'n/a', 'currency': 'BRL'},
+    ]
+    payload = {'results': [dict(balanceSheetHistory={'balanceSheetStatements': statements}, symbol='MIXED3')]}
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, re.compile(r'.*brapi.*/api/quote/MIXED3.*'), json=payload)
+        numpy_df = fetch_balance_sheet_history('MIXED3')['MIXED3']
+        brapi_wrapper.clear_cache()
+        arrow_df = fetch_balance_sheet_history('MIXED3', backend='arrow')['MIXED3']
+
+    assert (arrow_df.dtypes == 'double[pyarrow]').all()
+    pd.testing.assert_frame_equal(arrow_df.astype('float64'), numpy_df)
+    assert numpy_df.loc['Totalassets', '2023-12-31'] == 1050000
+
+@pytest.mark.parametrize('index', [
+    pd.date_range('2022-06-01', '2024-02-01', freq='30D', tz='UTC'),
+    pd.date_range('2022-06-01', '2024-02-01', freq='30D'),
+    pd.RangeIndex(20),
+])
+def test_extract_common_stock_data_kernel_matches_reindex(monkeypatch, index):
+    """Test that the numba forward-fill and the reindex fallback give the same frame"""
+    pytest.importorskip('numba')
+    bs_data = fetch_balance_sheet_history(TEST_TICKERS)
+    prices = pd.DataFrame(1.0, index=index, columns=TEST_TICKERS)
+
+    kernel_df = brapi_wrapper.extract_common_stock_data(bs_data, prices)
+    monkeypatch.setattr(brapi_wrapper, '_load_ffill_align', lambda: None)
+    reindex_df = brapi_wrapper.extract_common_stock_data(bs_data, prices)
+
+    pd.testing.assert_frame_equal(kernel_df, reindex_df)
+
+def test_numba_is_imported_lazily():
+    """Test that importing the wrapper does not import numba, only extract_common_stock_data does"""
+    code = 'import sys, brapi_wrapper; assert "numba" not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def test_make_request_caches_raw_bodies():
+    """Test that cached responses are stored as bytes and decoded fresh per call"""
+    first = brapi_wrapper.make_request('api/quote/PETR4.SA', {'range': '1d'})
+    first[0]['symbol'] = 'MUTATED'
+    second = brapi_wrapper.make_request('api/quote/PETR4.SA', {'range': '1d'})
+    assert second[0]['symbol'] == 'PETR4'
+    assert all(isinstance(content, bytes) for content in brapi_wrapper._RESPONSE_CACHE.values())
+
+    # Price histories are cached parsed, not a second time as raw responses
+    brapi_wrapper.clear_cache()
+    fetch_quote_close(TEST_TICKER)
+    assert len(brapi_wrapper._RESPONSE_CACHE) == 0
+    assert len(brapi_wrapper._HISTORY_CACHE) == 1
+
+def test_long_history_is_streamed(monkeypatch):
+    """Test that long ranges stream-parse to the same frames as short ones"""
+    pytest.importorskip('ijson')
+    streamed = []
+    stream_price_history = brapi_wrapper._stream_price_history
+
+    def _stream_price_history(ticker, params):
+        streamed.append(ticker)
+        return stream_price_history(ticker, params)
+
+    monkeypatch.setattr(brapi_wrapper, '_stream_price_history', _stream_price_history)
+
+    quote = fetch_quote(TEST_TICKER, range='5y')
+    assert quote.index.dtype == 'datetime64[ns, UTC]'
+    short = fetch_quote(TEST_TICKER)
+    pd.testing.assert_frame_equal(quote, short)
+
+    # Streamed columns follow the payload's own fields, like the batched path
+    history = [{'date': 1700000000, 'close': 37.8, 'volume': 41000000, 'currency': 'BRL'},
+               {'date': 1700086400, 'close': 38.5, 'volume': None, 'currency': 'BRL'}]
+    payload = {'results': [{'symbol': 'MIXED3', 'historicalDataPrice': history}]}
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, re.compile(r'.*brapi.*/api/quote/MIXED3.*'), json=payload)
+        pd.testing.assert_frame_equal(fetch_quote('MIXED3', range='5y'), fetch_quote('MIXED3', range='1y'))
+
+    close = fetch_quote_close(TEST_TICKERS, range='1mo', interval='15m')
+    assert close.index.dtype == 'datetime64[ns, UTC]'
+    pd.testing.assert_frame_equal(close, fetch_quote_close(TEST_TICKERS))
+    assert len(streamed) == 4
+
+@pytest.mark.live
+def test_fetch_quote_single_ticker_live():
+    result = fetch_quote(tickers=["AAPL"])
+    assert result is not None
+    assert "AAPL" in result
+
+@pytest.mark.live
+def test_fetch_quote_multiple_tickers_live():
+    result = fetch_quote(tickers=["AAPL", "GOOGL"])
+    assert result is not None
+    assert "AAPL" in result
+    assert "GOOGL" in result
+
+@pytest.mark.live
+def test_fetch_quote_invalid_ticker_live():
+    result = fetch_quote(tickers=["INVALID"])
+    assert result is not None
+    assert "INVALID" not in result
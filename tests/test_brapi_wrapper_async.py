@@ -0,0 +1,54 @@
+import asyncio
+
+import httpx
+import pytest
+import brapi_wrapper_async
+from brapi_wrapper_async import (
+    fetch_quote,
+    fetch_quote_close,
+    fetch_quote_close_async
+)
+
+HISTORY = [
+    {'date': 1700000000, 'open': 37.1, 'high': 38.0, 'low': 36.9, 'close': 37.8, 'volume': 41000000},
+    {'date': 1700086400, 'open': 37.8, 'high': 38.9, 'low': 37.5, 'close': 38.5, 'volume': 39500000},
+]
+
+def _handler(request):
+    """Reply like api/quote/{symbol}, MALFORMED gets an unparsable history and INVALID a 404"""
+    symbol = request.url.path.rsplit('/', 1)[-1]
+    if symbol.startswith('INVALID'):
+        return httpx.Response(404)
+    history = [{'date': 'not-a-date'}] if symbol.startswith('MALFORMED') else HISTORY
+    return httpx.Response(200, json={'results': [{'symbol': symbol, 'historicalDataPrice': history}]})
+
+@pytest.fixture(autouse=True)
+def mock_transport(monkeypatch):
+    """Serve the async client from _handler instead of the network"""
+    monkeypatch.setattr(brapi_wrapper_async, '_async_client',
+                        lambda: httpx.AsyncClient(base_url=brapi_wrapper_async.BASE_URL, transport=httpx.MockTransport(_handler)))
+
+def test_fetch_quote():
+    """Test fetching quote data for one and several tickers"""
+    result = fetch_quote('PETR4')
+    assert 'close' in result.columns
+
+    results = fetch_quote(['PETR4', 'VALE3', 'INVALID'])
+    assert list(results) == ['PETR4', 'VALE3']
+
+def test_fetch_quote_close_isolates_failing_ticker():
+    """Test that one ticker's parse error does not discard the others"""
+    close = fetch_quote_close(['PETR4', 'MALFORMED', 'VALE3', 'INVALID'], threads=2)
+    assert list(close.columns) == ['PETR4', 'VALE3']
+    assert (close.dtypes == 'float32').all()
+    assert close['PETR4'].tolist() == pytest.approx([37.8, 38.5])
+
+def test_blocking_wrapper_inside_running_loop():
+    """Test that the blocking wrappers refuse to nest asyncio.run, while the async variant works"""
+    async def _inside_loop():
+        with pytest.raises(RuntimeError):
+            fetch_quote_close('PETR4')
+        return await fetch_quote_close_async('PETR4')
+
+    close = asyncio.run(_inside_loop())
+    assert list(close.columns) == ['PETR4']